@@ -1,10 +1,16 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from dotenv import load_dotenv
+import io
 import os
 from pathlib import Path
+from typing import NamedTuple
 
 # Load environment variables
 load_dotenv()
@@ -16,45 +22,262 @@ st.set_page_config(
     layout="wide"
 )
 
-# Cache the data loading function
-@st.cache_data
-def load_data():
+# Columns used by the dashboard and their on-disk (Parquet) types
+REQUIRED_COLUMNS = [
+    'Country', 'CCode', 'weo_year', 'exercise', 'year', 'Region',
+    'incomegroup', 'Fngdp_rpc', 'pcpi_pch', 'bca_gdp',
+    'Rngdp_rpc', 'Rpcpi_pch', 'Rbca_gdp'
+]
+CATEGORY_COLUMNS = ['Country', 'Region', 'incomegroup']
+INT_COLUMNS = ['CCode', 'weo_year', 'exercise', 'year']
+FLOAT_COLUMNS = [
+    'Fngdp_rpc', 'pcpi_pch', 'bca_gdp',
+    'Rngdp_rpc', 'Rpcpi_pch', 'Rbca_gdp'
+]
+PARQUET_SCHEMA = pa.schema(
+    [(col, pa.dictionary(pa.int32(), pa.string())) for col in CATEGORY_COLUMNS] +
+    [(col, pa.int16()) for col in INT_COLUMNS] +
+    [(col, pa.float32()) for col in FLOAT_COLUMNS]
+)
+
+# Rows sent to the browser by the data table (the CSV export has them all)
+TABLE_MAX_ROWS = 1000
+
+# Sidebar labels and the columns/exercise values they select
+VARIABLES = {
+    'Previsões': {
+        'Crescimento do PIB': 'Fngdp_rpc',
+        'Inflação': 'pcpi_pch',
+        'Balanço de Conta Corrente': 'bca_gdp'
+    },
+    'Valores Realizados': {
+        'Crescimento do PIB': 'Rngdp_rpc',
+        'Inflação': 'Rpcpi_pch',
+        'Balanço de Conta Corrente': 'Rbca_gdp'
+    }
+}
+EXERCISE_OPTIONS = {
+    '1° Semestre': 1,
+    '2° Semestre': 2,
+    'Média': 'mean'
+}
+
+# Rodapé com créditos, GitHub e LinkedIn
+FOOTER_HTML = """
+<div style="text-align: center; padding: 20px 0; font-size: 14px; color: #555;">
+    Desenvolvido por Mateus Fonseca e Anderson de Castro Moura<br><br>
+    <a href="https://github.com/andersonmoura87/forecast_inflation_visualization" 
+       target="_blank" 
+       style="color: #0366d6; text-decoration: none; margin: 0 15px;"
+       onmouseover="this.style.textDecoration='underline';"
+       onmouseout="this.style.textDecoration='none';"
+       aria-label="Repositório do projeto no GitHub">
+        <svg style="vertical-align: middle; margin-right: 5px;" width="16" height="16" viewBox="0 0 16 16" fill="currentColor">
+            <path fill-rule="evenodd" d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/>
+        </svg>
+        Repositório no GitHub
+    </a><br><br>
+    <a href="https://www.linkedin.com/in/mateus-rr-fonseca/" 
+       target="_blank" 
+       style="color: #0366d6; text-decoration: none; margin: 0 15px;"
+       onmouseover="this.style.textDecoration='underline';"
+       onmouseout="this.style.textDecoration='none';"
+       aria-label="Perfil do LinkedIn de Mateus Fonseca">
+        <svg style="vertical-align: middle; margin-right: 5px;" width="16" height="16" viewBox="0 0 16 16" fill="currentColor">
+            <path d="M0 1.146C0 .513.526 0 1.175 0h13.65C15.474 0 16 .513 16 1.146v13.708c0 .633-.526 1.146-1.175 1.146H1.175C.526 16 0 15.487 0 14.854V1.146zm4.943 12.248V6.169H2.542v7.225h2.401zm-1.2-8.212c.837 0 1.358-.554 1.358-1.248-.015-.709-.52-1.248-1.342-1.248-.822 0-1.359.54-1.359 1.248 0 .694.521 1.248 1.327 1.248h.016zm4.908 8.212V9.359c0-.216.016-.432.08-.586.173-.431.568-.878 1.232-.878.869 0 1.216.662 1.216 1.634v3.865h2.401V9.25c0-2.22-1.184-3.252-2.764-3.252-1.274 0-1.845.7-2.165 1.193v.025h-.016a5.54 5.54 0 0 1 .016-.025V6.169h-2.4c.03.678 0 7.225 0 7.225h2.4z"/>
+        </svg>
+        Mateus Fonseca
+    </a>
+    <a href="https://www.linkedin.com/in/andersondecastromoura/" 
+       target="_blank" 
+       style="color: #0366d6; text-decoration: none; margin: 0 15px;"
+       onmouseover="this.style.textDecoration='underline';"
+       onmouseout="this.style.textDecoration='none';"
+       aria-label="Perfil do LinkedIn de Anderson de Castro Moura">
+        <svg style="vertical-align: middle; margin-right: 5px;" width="16" height="16" viewBox="0 0 16 16" fill="currentColor">
+            <path d="M0 1.146C0 .513.526 0 1.175 0h13.65C15.474 0 16 .513 16 1.146v13.708c0 .633-.526 1.146-1.175 1.146H1.175C.526 16 0 15.487 0 14.854V1.146zm4.943 12.248V6.169H2.542v7.225h2.401zm-1.2-8.212c.837 0 1.358-.554 1.358-1.248-.015-.709-.52-1.248-1.342-1.248-.822 0-1.359.54-1.359 1.248 0 .694.521 1.248 1.327 1.248h.016zm4.908 8.212V9.359c0-.216.016-.432.08-.586.173-.431.568-.878 1.232-.878.869 0 1.216.662 1.216 1.634v3.865h2.401V9.25c0-2.22-1.184-3.252-2.764-3.252-1.274 0-1.845.7-2.165 1.193v.025h-.016a5.54 5.54 0 0 1 .016-.025V6.169h-2.4c.03.678 0 7.225 0 7.225h2.4z"/>
+        </svg>
+        Anderson de Castro Moura
+    </a>
+</div>
+"""
+
+def _read_dataset(data_path):
+    """Read the dataset through its Parquet sidecar.
+
+    The sidecar is (re)built from the Excel file if missing or outdated. If it
+    can't be written, the freshly parsed data is returned from memory instead.
+    """
+    data_path = Path(data_path)
+    parquet_path = data_path.with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= data_path.stat().st_mtime:
+        return pd.read_parquet(parquet_path, engine="pyarrow", columns=REQUIRED_COLUMNS)
+    
+    df = pd.read_excel(data_path)
+    
+    # Basic data validation
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing_columns:
+        raise ValueError(f"Colunas faltantes no dataset: {missing_columns}")
+    
+    df = df[REQUIRED_COLUMNS]
+    df = df.astype({
+        **{col: 'category' for col in CATEGORY_COLUMNS},
+        **{col: 'int16' for col in INT_COLUMNS},
+        **{col: 'float32' for col in FLOAT_COLUMNS}
+    })
+    
+    # Handle extreme values (e.g., Zimbabwe's hyperinflation)
+    for col in ['pcpi_pch', 'Rpcpi_pch']:
+        df[col] = df[col].clip(-100, 100)  # Cap inflation at ±100%
+    
+    table = pa.Table.from_pandas(df, schema=PARQUET_SCHEMA, preserve_index=False)
+    
+    # Write to a temporary file first so an interrupted write never leaves a
+    # truncated sidecar that looks newer than the Excel file
+    tmp_path = parquet_path.with_name(f".{parquet_path.name}.{os.getpid()}.tmp")
+    try:
+        pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        # e.g. a read-only deploy: serve the data without a sidecar
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    
+    return table.to_pandas()[REQUIRED_COLUMNS]
+
+def data_source():
+    """Return the configured data path and the Excel file's modification time.
+
+    Cached functions take both as arguments, so a new DATA_PATH or an updated
+    Excel file invalidates their entries, including the persisted one.
+    """
+    data_path = os.getenv("DATA_PATH")
+    try:
+        mtime = Path(data_path).stat().st_mtime if data_path else None
+    except OSError:
+        mtime = None
+    return data_path, mtime
+
+# Cache the data loading function (persisted across server restarts)
+@st.cache_data(persist="disk", show_spinner="Carregando WEO…", max_entries=1)
+def load_data(data_path, mtime):
     """Load and preprocess the WEO dataset."""
     try:
-        data_path = os.getenv("DATA_PATH")
         if not data_path:
             st.error("DATA_PATH não encontrada no arquivo .env")
             return None
         
-        df = pd.read_excel(data_path)
-        
-        # Basic data validation
-        required_columns = [
-            'Country', 'CCode', 'weo_year', 'exercise', 'year', 'Region',
-            'incomegroup', 'Fngdp_rpc', 'pcpi_pch', 'bca_gdp',
-            'Rngdp_rpc', 'Rpcpi_pch', 'Rbca_gdp'
-        ]
+        # Types and inflation capping are baked into the Parquet sidecar
+        df = _read_dataset(data_path)
         
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            st.error(f"Colunas faltantes no dataset: {missing_columns}")
-            return None
-            
-        # Convert year to integer
-        df['year'] = df['year'].astype(int)
+        # Keep categories sorted so they can serve directly as filter options
+        for col in CATEGORY_COLUMNS:
+            df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
         
-        # Handle extreme values (e.g., Zimbabwe's hyperinflation)
-        for col in ['pcpi_pch', 'Rpcpi_pch']:
-            df[col] = df[col].clip(-100, 100)  # Cap inflation at ±100%
-            
         return df
     
     except Exception as e:
         st.error(f"Erro ao carregar os dados: {str(e)}")
         return None
 
-def create_line_plot(df, countries, variable, title):
+@st.cache_resource(max_entries=1)
+def get_indexed(data_path, mtime):
+    """Return the dataset indexed by the filter columns for fast slicing.
+
+    Country and year lead the index, so slices come out ordered for display.
+    """
+    df = load_data(data_path, mtime)
+    # NaNs first keeps the index fully lexsorted (incomegroup has missing values)
+    return df.set_index(
+        ['Country', 'year', 'Region', 'incomegroup', 'exercise']
+    ).sort_index(na_position='first')
+
+class FilterOptions(NamedTuple):
+    """Sidebar options derived from the dataset."""
+    countries: list
+    regions: list
+    income_groups: list
+    year_bounds: tuple
+
+@st.cache_data(max_entries=1)
+def get_filter_options(data_path, mtime):
+    """Collect the sidebar filter options once instead of on every rerun."""
+    df = load_data(data_path, mtime)
+    return FilterOptions(
+        countries=df['Country'].cat.categories.tolist(),
+        regions=df['Region'].cat.categories.tolist(),
+        income_groups=df['incomegroup'].cat.categories.tolist(),
+        year_bounds=(int(df['year'].min()), int(df['year'].max()))
+    )
+
+class Filters(NamedTuple):
+    """Hashable snapshot of the sidebar selection, used as a cache key."""
+    countries: tuple
+    year_range: tuple
+    region: str
+    income: str
+    exercise: object
+    variable: str
+    source: tuple  # (data_path, mtime) from data_source()
+
+def current_filters():
+    """Build the Filters for the sidebar widgets' current values.
+
+    Fragments call this instead of taking the filters as arguments: on a
+    fragment-only rerun Streamlit replays the arguments of the first call.
+    """
+    state = st.session_state
+    return Filters(
+        countries=tuple(sorted(state.countries)),
+        year_range=tuple(state.year_range),
+        region=state.region,
+        income=state.income,
+        exercise=EXERCISE_OPTIONS[state.exercise],
+        variable=VARIABLES[state.variable_type][state.variable],
+        source=data_source()
+    )
+
+@st.cache_data(max_entries=32)
+def filter_data(filters):
+    """Return the rows matching the sidebar filters."""
+    indexed = get_indexed(*filters.source)
+    region_slice = slice(None) if filters.region == 'Todas' else filters.region
+    income_slice = slice(None) if filters.income == 'Todos' else filters.income
+    exercise_slice = slice(None) if filters.exercise == 'mean' else filters.exercise
+    try:
+        df = indexed.loc[
+            (list(filters.countries), slice(filters.year_range[0], filters.year_range[1]),
+             region_slice, income_slice, exercise_slice), :
+        ].reset_index()
+    except pd.errors.UnsortedIndexError:
+        # A KeyError subclass, but a bug in get_indexed rather than an empty result
+        raise
+    except KeyError:
+        # No rows for this combination of filters
+        df = indexed.iloc[0:0].reset_index()
+    
+    if filters.exercise == 'mean':
+        # Calculate mean for each country and year
+        df = df.groupby(['Country', 'year'], observed=True)[filters.variable].mean().reset_index()
+    else:
+        # reset_index() moves the index levels to the front; keep the source order
+        df = df[REQUIRED_COLUMNS]
+    
+    # Plotly Express groups by every category, so drop those without rows
+    return df.assign(**{
+        col: df[col].cat.remove_unused_categories()
+        for col in CATEGORY_COLUMNS if col in df.columns
+    })
+
+@st.cache_data(max_entries=32, ttl="10m")
+def create_line_plot(filters, title):
     """Create an interactive bar plot."""
+    df = filter_data(filters)
+    variable = filters.variable
+    
     # Create a custom hover template that includes exercise information if available
     hover_template = (
         "<b>%{x}</b><br>" +
@@ -63,7 +286,7 @@ def create_line_plot(df, countries, variable, title):
     )
     
     fig = px.bar(
-        df[df['Country'].isin(countries)],
+        df,
         x='year',
         y=variable,
         color='Country',
@@ -73,13 +296,13 @@ def create_line_plot(df, countries, variable, title):
             variable: 'Valor (%)',
             'Country': 'País/Agregado'
         },
-        custom_data=['exercise'] if 'exercise' in df.columns else None,
         barmode='group'  # Agrupa as barras por ano
     )
     
-    # Update hover template if exercise data is available
+    # Update hover template if exercise data is available. The exercise is
+    # fixed by the filters, so it is not shipped per point as custom_data
     if 'exercise' in df.columns:
-        hover_template += "<br>Exercício: %{customdata[0]}"
+        hover_template += f"<br>Exercício: {filters.exercise}"
     
     fig.update_traces(
         hovertemplate=hover_template
@@ -109,78 +332,203 @@ def create_line_plot(df, countries, variable, title):
         bargap=0.15,  # Espaço entre grupos de barras
         bargroupgap=0.1  # Espaço entre barras do mesmo grupo
     )
-    return fig
+    return fig.to_dict()
 
-def create_bar_plot(df, variable, year, group_by='Country'):
+@st.cache_data(max_entries=32, ttl="10m")
+def create_bar_plot(filters, year, group_by='Country'):
     """Create a bar plot comparing values across countries/regions."""
+    df = filter_data(filters)
+    variable = filters.variable
     df_filtered = df[df['year'] == year]
-    df_grouped = df_filtered.groupby(group_by)[variable].mean().reset_index()
+    df_grouped = df_filtered.groupby(group_by, observed=True, sort=False)[variable].mean()
     
-    fig = px.bar(
-        df_grouped,
-        x=group_by,
-        y=variable,
-        title=f'Média de {variable} por {group_by} em {year}',
-        labels={
-            group_by: group_by,
-            variable: 'Valor (%)'
-        }
+    fig = go.Figure(
+        go.Bar(
+            x=df_grouped.index.astype(str),
+            y=df_grouped.values
+        )
     )
     fig.update_layout(
+        title=f'Média de {variable} por {group_by} em {year}',
+        xaxis_title=group_by,
+        yaxis_title='Valor (%)',
         xaxis_tickangle=-45,
         showlegend=False
     )
-    return fig
+    return fig.to_dict()
 
-def create_scatter_plot(df, variable, year):
+@st.cache_data(max_entries=32, ttl="10m")
+def create_scatter_plot(filters, year):
     """Create a scatter plot comparing forecast vs actual values."""
+    df = filter_data(filters)
+    variable = filters.variable
     forecast_col = variable
     actual_col = 'R' + variable[1:] if variable.startswith('F') else variable
     
     df_filtered = df[df['year'] == year]
     
-    fig = px.scatter(
-        df_filtered,
-        x=forecast_col,
-        y=actual_col,
-        color='Country',
+    # One WebGL trace for all countries, colored by category code; the
+    # colorbar labels each code with its country and acts as the legend
+    cats = df_filtered['Country'].cat.categories.tolist()
+    fig = go.Figure(
+        go.Scattergl(
+            x=df_filtered[forecast_col],
+            y=df_filtered[actual_col],
+            mode='markers',
+            marker=dict(
+                color=df_filtered['Country'].cat.codes.to_numpy(),
+                colorscale='Turbo',
+                cmin=0,
+                cmax=max(len(cats) - 1, 1),
+                showscale=True,
+                colorbar=dict(
+                    title='País/Agregado',
+                    tickvals=list(range(len(cats))),
+                    ticktext=cats
+                )
+            ),
+            text=df_filtered['Country'].astype(str),
+            hovertemplate=(
+                "<b>%{text}</b><br>" +
+                "Previsão: %{x:.2f}%<br>" +
+                "Realizado: %{y:.2f}%<extra></extra>"
+            ),
+            name='País/Agregado'
+        )
+    )
+    fig.update_layout(
         title=f'Previsão vs. Realizado - {variable} em {year}',
-        labels={
-            forecast_col: 'Previsão (%)',
-            actual_col: 'Realizado (%)',
-            'Country': 'País/Agregado'
-        }
+        xaxis_title='Previsão (%)',
+        yaxis_title='Realizado (%)'
     )
     
     # Add 45-degree line
-    max_val = max(df_filtered[[forecast_col, actual_col]].max())
+    max_val = np.nanmax(df_filtered[[forecast_col, actual_col]].to_numpy(), initial=-np.inf)
+    if not np.isfinite(max_val):
+        max_val = 1.0
     fig.add_trace(
         go.Scatter(
-            x=[0, max_val],  
-            y=[0, max_val],
+            x=[0, float(max_val)],
+            y=[0, float(max_val)],
             mode='lines',
             line=dict(dash='dash', color='gray'),
             name='Linha de 45°'
         )
     )
     
-    return fig
+    return fig.to_dict()
+
+def _cached_figure(fig_dict):
+    """Rebuild a memoized figure; it was already validated when first built."""
+    return go.Figure(fig_dict, _validate=False)
+
+@st.cache_data(max_entries=32)
+def export_csv(filters):
+    """Serialize the filtered rows to CSV bytes with PyArrow's writer."""
+    buffer = io.BytesIO()
+    pacsv.write_csv(pa.Table.from_pandas(filter_data(filters), preserve_index=False), buffer)
+    return buffer.getvalue()
+
+@st.fragment
+def _bar_block():
+    """Render the country/region comparison; reruns on its own widgets only."""
+    filters = current_filters()
+    st.subheader("Comparação entre Países/Regiões")
+    year_opts = list(range(filters.year_range[0], filters.year_range[1] + 1))
+    selected_year = st.selectbox(
+        "Selecione o ano para comparação",
+        options=year_opts,
+        key='compare_year'
+    )
+    
+    group_by = st.radio(
+        "Agrupar por",
+        options=['Country', 'Region'],
+        format_func=lambda x: 'País' if x == 'Country' else 'Região'
+    )
+    
+    fig_bar = _cached_figure(create_bar_plot(
+        filters,
+        selected_year,
+        group_by
+    ))
+    st.plotly_chart(fig_bar, use_container_width=True)
+    
+    # The scatter plot follows the year picked above and only applies to forecasts
+    if st.session_state.variable_type == 'Previsões':
+        _scatter_block()
+
+@st.fragment
+def _scatter_block():
+    """Render the optional forecast vs. actual scatter plot."""
+    filters = current_filters()
+    st.subheader("Comparação Previsão vs. Realizado")
+    show_scatter = st.checkbox("Mostrar gráfico de dispersão")
+    
+    if show_scatter:
+        fig_scatter = _cached_figure(create_scatter_plot(
+            filters,
+            st.session_state.compare_year
+        ))
+        st.plotly_chart(fig_scatter, use_container_width=True)
+
+@st.fragment
+def _table_block():
+    """Render the filtered data table and the CSV export."""
+    filters = current_filters()
+    filtered_df = filter_data(filters)
+    st.subheader("Dados Filtrados")
+    view = filtered_df[[
+        'Country', 'year', 'Region', 'incomegroup',
+        filters.variable
+    ]]
+    st.dataframe(
+        view.head(TABLE_MAX_ROWS),
+        use_container_width=True,
+        height=400
+    )
+    if len(view) > TABLE_MAX_ROWS:
+        st.caption(
+            f"Exibindo as primeiras {TABLE_MAX_ROWS} de {len(view)} linhas. "
+            "Baixe o CSV para obter todos os dados filtrados."
+        )
+    
+    # Export button (sempre visível, só habilitado se houver dados)
+    st.download_button(
+        label="Baixar CSV",
+        data=export_csv(filters),
+        file_name="weo_filtered_data.csv",
+        mime="text/csv",
+        disabled=filtered_df.empty
+    )
+
+@st.fragment
+def _footer():
+    """Render the static credits footer."""
+    # st.html's sanitizer would drop the inline SVG icons and target="_blank"
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 def main():
     # Load data
-    df = load_data()
+    source = data_source()
+    df = load_data(*source)
     if df is None:
+        # Don't keep the failure in the persisted cache
+        load_data.clear()
         st.stop()
     
+    options = get_filter_options(*source)
+    
     # Sidebar filters
     st.sidebar.title("Filtros")
     
     # Country selection (multiselect, removendo nulos)
-    country_options = sorted([x for x in df['Country'].unique().tolist() if pd.notnull(x)])
+    country_options = options.countries
     countries = st.sidebar.multiselect(
         "Selecione países/agregados",
         options=country_options,
-        default=['Brazil', 'United States', 'World'] if set(['Brazil', 'United States', 'World']).issubset(set(country_options)) else country_options[:1]
+        default=['Brazil', 'United States', 'World'] if set(['Brazil', 'United States', 'World']).issubset(set(country_options)) else country_options[:1],
+        key='countries'
     )
     
     if not countries:
@@ -188,85 +536,61 @@ def main():
         st.stop()
     
     # Year range selection
-    min_year, max_year = int(df['year'].min()), int(df['year'].max())
-    year_range = st.sidebar.slider(
+    min_year, max_year = options.year_bounds
+    st.sidebar.slider(
         "Selecione o intervalo de anos",
         min_year,
         max_year,
-        (min_year, max_year)
+        (min_year, max_year),
+        key='year_range'
     )
     
     # Region selection (removendo nulos)
-    region_options = ['Todas'] + sorted([x for x in df['Region'].unique().tolist() if pd.notnull(x)])
-    selected_region = st.sidebar.selectbox(
+    region_options = ['Todas'] + options.regions
+    st.sidebar.selectbox(
         "Selecione a região",
-        options=region_options
+        options=region_options,
+        key='region'
     )
     
     # Income group selection (removendo nulos)
-    income_groups = ['Todos'] + sorted([x for x in df['incomegroup'].unique().tolist() if pd.notnull(x)])
-    selected_income = st.sidebar.selectbox(
+    income_groups = ['Todos'] + options.income_groups
+    st.sidebar.selectbox(
         "Selecione o grupo de renda",
-        options=income_groups
+        options=income_groups,
+        key='income'
     )
     
     # Variable type selection
     variable_type = st.sidebar.radio(
         "Selecione o tipo de variável",
-        options=['Previsões', 'Valores Realizados']
+        options=['Previsões', 'Valores Realizados'],
+        key='variable_type'
     )
     
     # Variable selection
-    if variable_type == 'Previsões':
-        variables = {
-            'Crescimento do PIB': 'Fngdp_rpc',
-            'Inflação': 'pcpi_pch',
-            'Balanço de Conta Corrente': 'bca_gdp'
-        }
-    else:
-        variables = {
-            'Crescimento do PIB': 'Rngdp_rpc',
-            'Inflação': 'Rpcpi_pch',
-            'Balanço de Conta Corrente': 'Rbca_gdp'
-        }
-    
+    variables = VARIABLES[variable_type]
     selected_variable = st.sidebar.selectbox(
         "Selecione a variável",
-        options=list(variables.keys())
+        options=list(variables.keys()),
+        key='variable'
     )
 
     # Exercise selection
-    exercise_options = {
-        '1° Semestre': 1,
-        '2° Semestre': 2,
-        'Média': 'mean'
-    }
     selected_exercise = st.sidebar.selectbox(
         "Selecione o exercício da previsão",
-        options=list(exercise_options.keys()),
+        options=list(EXERCISE_OPTIONS.keys()),
         index=1,  # Default to 2° Semestre
-        help="1° Semestre: previsões de abril | 2° Semestre: previsões de outubro | Média: média das previsões dos dois semestres"
+        help="1° Semestre: previsões de abril | 2° Semestre: previsões de outubro | Média: média das previsões dos dois semestres",
+        key='exercise'
     )
     
     # Apply filters
-    filtered_df = df[
-        (df['Country'].isin(countries)) &
-        (df['year'].between(year_range[0], year_range[1]))
-    ]
-    
-    if selected_region != 'Todas':
-        filtered_df = filtered_df[filtered_df['Region'] == selected_region]
+    filters = current_filters()
     
-    if selected_income != 'Todos':
-        filtered_df = filtered_df[filtered_df['incomegroup'] == selected_income]
-
-    # Handle exercise selection
     if selected_exercise != 'Média':
-        filtered_df = filtered_df[filtered_df['exercise'] == exercise_options[selected_exercise]]
         exercise_title = f" - Previsões do {selected_exercise}"
     else:
-        # Calculate mean for each country and year
-        filtered_df = filtered_df.groupby(['Country', 'year'])[variables[selected_variable]].mean().reset_index()
         exercise_title = " - Média das Previsões"
     
     # Main content
@@ -280,110 +604,16 @@ def main():
     
     # Line plot
     st.subheader("Evolução Temporal")
-    fig_line = create_line_plot(
-        filtered_df,
-        countries,
-        variables[selected_variable],
+    fig_line = _cached_figure(create_line_plot(
+        filters,
         f"Evolução de {selected_variable}{exercise_title}"
-    )
+    ))
     st.plotly_chart(fig_line, use_container_width=True)
     
-    # Bar plot
-    st.subheader("Comparação entre Países/Regiões")
-    selected_year = st.selectbox(
-        "Selecione o ano para comparação",
-        options=sorted(filtered_df['year'].unique())
-    )
-    
-    group_by = st.radio(
-        "Agrupar por",
-        options=['Country', 'Region'],
-        format_func=lambda x: 'País' if x == 'Country' else 'Região'
-    )
-    
-    fig_bar = create_bar_plot(
-        filtered_df,
-        variables[selected_variable],
-        selected_year,
-        group_by
-    )
-    st.plotly_chart(fig_bar, use_container_width=True)
-    
-    # Scatter plot (optional)
-    st.subheader("Comparação Previsão vs. Realizado")
-    show_scatter = st.checkbox("Mostrar gráfico de dispersão")
+    _bar_block()
+    _table_block()
     
-    if show_scatter:
-        if variable_type != 'Previsões':
-            st.info("O gráfico de dispersão só está disponível para variáveis de previsão.")
-        else:
-            fig_scatter = create_scatter_plot(
-                filtered_df,
-                variables[selected_variable],
-                selected_year
-            )
-            st.plotly_chart(fig_scatter, use_container_width=True)
-    
-    # Data table
-    st.subheader("Dados Filtrados")
-    st.dataframe(
-        filtered_df[[
-            'Country', 'year', 'Region', 'incomegroup',
-            variables[selected_variable]
-        ]].sort_values(['Country', 'year']),
-        use_container_width=True
-    )
-    
-    # Export button (sempre visível, só habilitado se houver dados)
-    csv = filtered_df.to_csv(index=False)
-    st.download_button(
-        label="Baixar CSV",
-        data=csv,
-        file_name="weo_filtered_data.csv",
-        mime="text/csv",
-        disabled=filtered_df.empty
-    )
-
-
-# Rodapé com créditos, GitHub e LinkedIn
-st.markdown("""
-<div style="text-align: center; padding: 20px 0; font-size: 14px; color: #555;">
-    Desenvolvido por Mateus Fonseca e Anderson de Castro Moura<br><br>
-    <a href="https://github.com/andersonmoura87/forecast_inflation_visualization" 
-       target="_blank" 
-       style="color: #0366d6; text-decoration: none; margin: 0 15px;"
-       onmouseover="this.style.textDecoration='underline';"
-       onmouseout="this.style.textDecoration='none';"
-       aria-label="Repositório do projeto no GitHub">
-        <svg style="vertical-align: middle; margin-right: 5px;" width="16" height="16" viewBox="0 0 16 16" fill="currentColor">
-            <path fill-rule="evenodd" d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/>
-        </svg>
-        Repositório no GitHub
-    </a><br><br>
-    <a href="https://www.linkedin.com/in/mateus-rr-fonseca/" 
-       target="_blank" 
-       style="color: #0366d6; text-decoration: none; margin: 0 15px;"
-       onmouseover="this.style.textDecoration='underline';"
-       onmouseout="this.style.textDecoration='none';"
-       aria-label="Perfil do LinkedIn de Mateus Fonseca">
-        <svg style="vertical-align: middle; margin-right: 5px;" width="16" height="16" viewBox="0 0 16 16" fill="currentColor">
-            <path d="M0 1.146C0 .513.526 0 1.175 0h13.65C15.474 0 16 .513 16 1.146v13.708c0 .633-.526 1.146-1.175 1.146H1.175C.526 16 0 15.487 0 14.854V1.146zm4.943 12.248V6.169H2.542v7.225h2.401zm-1.2-8.212c.837 0 1.358-.554 1.358-1.248-.015-.709-.52-1.248-1.342-1.248-.822 0-1.359.54-1.359 1.248 0 .694.521 1.248 1.327 1.248h.016zm4.908 8.212V9.359c0-.216.016-.432.08-.586.173-.431.568-.878 1.232-.878.869 0 1.216.662 1.216 1.634v3.865h2.401V9.25c0-2.22-1.184-3.252-2.764-3.252-1.274 0-1.845.7-2.165 1.193v.025h-.016a5.54 5.54 0 0 1 .016-.025V6.169h-2.4c.03.678 0 7.225 0 7.225h2.4z"/>
-        </svg>
-        Mateus Fonseca
-    </a>
-    <a href="https://www.linkedin.com/in/andersondecastromoura/" 
-       target="_blank" 
-       style="color: #0366d6; text-decoration: none; margin: 0 15px;"
-       onmouseover="this.style.textDecoration='underline';"
-       onmouseout="this.style.textDecoration='none';"
-       aria-label="Perfil do LinkedIn de Anderson de Castro Moura">
-        <svg style="vertical-align: middle; margin-right: 5px;" width="16" height="16" viewBox="0 0 16 16" fill="currentColor">
-            <path d="M0 1.146C0 .513.526 0 1.175 0h13.65C15.474 0 16 .513 16 1.146v13.708c0 .633-.526 1.146-1.175 1.146H1.175C.526 16 0 15.487 0 14.854V1.146zm4.943 12.248V6.169H2.542v7.225h2.401zm-1.2-8.212c.837 0 1.358-.554 1.358-1.248-.015-.709-.52-1.248-1.342-1.248-.822 0-1.359.54-1.359 1.248 0 .694.521 1.248 1.327 1.248h.016zm4.908 8.212V9.359c0-.216.016-.432.08-.586.173-.431.568-.878 1.232-.878.869 0 1.216.662 1.216 1.634v3.865h2.401V9.25c0-2.22-1.184-3.252-2.764-3.252-1.274 0-1.845.7-2.165 1.193v.025h-.016a5.54 5.54 0 0 1 .016-.025V6.169h-2.4c.03.678 0 7.225 0 7.225h2.4z"/>
-        </svg>
-        Anderson de Castro Moura
-    </a>
-</div>
-""", unsafe_allow_html=True)
+    _footer()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file